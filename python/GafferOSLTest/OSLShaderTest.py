@@ -167,6 +167,22 @@ class OSLShaderTest( GafferOSLTest.OSLTestCase ) :
 		n = GafferOSL.OSLShader()
 		self.assertRaises( RuntimeError, n.loadShader,  "nonexistent" )
 
+	def testLoadShaderAfterFailure( self ) :
+
+		shaderName = self.temporaryDirectory() + "/types"
+
+		n = GafferOSL.OSLShader()
+		self.assertRaises( RuntimeError, n.loadShader, shaderName )
+
+		# Once the shader exists, loading it must succeed, rather
+		# than repeating the previous failure.
+
+		s = self.compileShader( os.path.dirname( __file__ ) + "/shaders/types.osl" )
+		self.assertEqual( s, shaderName )
+
+		n.loadShader( shaderName )
+		self.assertEqual( n["parameters"].keys(), [ "i", "f", "c", "s", "m" ] )
+
 	def testSearchPaths( self ) :
 
 		standardShaderPaths = os.environ["OSL_SHADER_PATHS"]
@@ -43,107 +43,124 @@ import IECore
 import Gaffer
 import GafferTest
 
+_dynamicFlags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic
+
+# Values computed by the CachingTestNode in the caching tests.
+_stringDataD = IECore.StringData( "d" )
+_stringDataPig = IECore.StringData( "pig" )
+_stringDataA = IECore.StringData( "a" )
+
 class ValuePlugTest( GafferTest.TestCase ) :
 
 	def testCacheMemoryLimit( self ) :
 
-		n = GafferTest.CachingTestNode()
+		n = self.__cachingTestNode()
 
 		n["in"].setValue( "d" )
 
-		v1 = n["out"].getValue( _copy=False )
-		v2 = n["out"].getValue( _copy=False )
+		# The graph isn't changed during the test, so we can compute
+		# the hash once and reuse it for every getValue() call.
+		h = n["out"].hash()
+
+		originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		self.addCleanup( Gaffer.ValuePlug.setCacheMemoryLimit, originalCacheMemoryLimit )
+
+		v1 = n["out"].getValue( _copy=False, _precomputedHash=h )
+		v2 = n["out"].getValue( _copy=False, _precomputedHash=h )
 
 		self.assertEqual( v1, v2 )
-		self.assertEqual( v1, IECore.StringData( "d" ) )
+		self.assertEqual( v1, _stringDataD )
 
 		# the objects should be one and the same, as the second computation
 		# should have shortcut and returned a cached result.
-		self.failUnless( v1.isSame( v2 ) )
+		self.assertSame( v1, v2 )
 
 		Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
 
-		v3 = n["out"].getValue( _copy=False )
-		self.assertEqual( v3, IECore.StringData( "d" ) )
+		v3 = n["out"].getValue( _copy=False, _precomputedHash=h )
+		self.assertEqual( v3, _stringDataD )
 
 		# the objects should be different, as we cleared the cache.
-		self.failIf( v3.isSame( v2 ) )
+		self.assertNotSame( v3, v2 )
 
-		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+		Gaffer.ValuePlug.setCacheMemoryLimit( originalCacheMemoryLimit )
 
-		v1 = n["out"].getValue( _copy=False )
-		v2 = n["out"].getValue( _copy=False )
+		v1 = n["out"].getValue( _copy=False, _precomputedHash=h )
+		v2 = n["out"].getValue( _copy=False, _precomputedHash=h )
 
 		self.assertEqual( v1, v2 )
-		self.assertEqual( v1, IECore.StringData( "d" ) )
+		self.assertEqual( v1, _stringDataD )
 
 		# the objects should be one and the same, as we reenabled the cache.
-		self.failUnless( v1.isSame( v2 ) )
+		self.assertSame( v1, v2 )
 
 		Gaffer.ValuePlug.clearCache()
 		self.assertEqual( Gaffer.ValuePlug.cacheMemoryUsage(), 0 )
 
-		v3 = n["out"].getValue( _copy=False )
-		self.failIf( v3.isSame( v2 ) )
+		v3 = n["out"].getValue( _copy=False, _precomputedHash=h )
+		self.assertNotSame( v3, v2 )
 
-		v4 = n["out"].getValue( _copy=False )
-		self.failUnless( v4.isSame( v3 ) )
+		v4 = n["out"].getValue( _copy=False, _precomputedHash=h )
+		self.assertSame( v4, v3 )
 
 	def testSettable( self ) :
 
 		p1 = Gaffer.IntPlug( direction = Gaffer.Plug.Direction.In )
-		self.failUnless( p1.settable() )
+		self.assertTrue( p1.settable() )
 
 		p2 = Gaffer.IntPlug( direction = Gaffer.Plug.Direction.Out )
-		self.failIf( p2.settable() )
+		self.assertFalse( p2.settable() )
 
 		p1.setInput( p2 )
-		self.failIf( p1.settable() )
+		self.assertFalse( p1.settable() )
 
 	def testUncacheabilityPropagates( self ) :
 
-		n = GafferTest.CachingTestNode()
+		n = self.__cachingTestNode()
 		n["in"].setValue( "pig" )
 
-		p1 = Gaffer.ObjectPlug( "p1", Gaffer.Plug.Direction.In, IECore.IntData( 10 ) )
-		p2 = Gaffer.ObjectPlug( "p2", Gaffer.Plug.Direction.In, IECore.IntData( 20 ) )
-		p3 = Gaffer.ObjectPlug( "p3", Gaffer.Plug.Direction.In, IECore.IntData( 30 ) )
-
-		p1.setInput( n["out"] )
-		p2.setInput( p1 )
-		p3.setInput( p2 )
+		p1, p2, p3 = self.__cachingTestPlugs
+		h2 = p2.hash()
+		h3 = p3.hash()
 
-		o2 = p2.getValue( _copy = False )
-		o3 = p3.getValue( _copy = False )
+		o2 = p2.getValue( _copy = False, _precomputedHash = h2 )
+		o3 = p3.getValue( _copy = False, _precomputedHash = h3 )
 
-		self.assertEqual( o2, IECore.StringData( "pig" ) )
-		self.assertEqual( o3, IECore.StringData( "pig" ) )
-		self.failUnless( o2.isSame( o3 ) ) # they share cache entries
+		self.assertEqual( o2, _stringDataPig )
+		self.assertEqual( o3, _stringDataPig )
+		self.assertSame( o2, o3 ) # they share cache entries
 
 		n["out"].setFlags( Gaffer.Plug.Flags.Cacheable, False )
 
-		o2 = p2.getValue( _copy = False )
-		o3 = p3.getValue( _copy = False )
+		o2 = p2.getValue( _copy = False, _precomputedHash = h2 )
+		o3 = p3.getValue( _copy = False, _precomputedHash = h3 )
 
-		self.assertEqual( o2, IECore.StringData( "pig" ) )
-		self.assertEqual( o3, IECore.StringData( "pig" ) )
-		self.failIf( o2.isSame( o3 ) ) # they shouldn't share cache entries
+		self.assertEqual( o2, _stringDataPig )
+		self.assertEqual( o3, _stringDataPig )
+		self.assertNotSame( o2, o3 ) # they shouldn't share cache entries
 
 	def testSetValueSignalsDirtiness( self ) :
 
 		n = Gaffer.Node()
 		n["p"] = Gaffer.IntPlug()
 
-		cs = GafferTest.CapturingSlot( n.plugDirtiedSignal() )
+		count = [ 0 ]
+		lastDirtied = [ None ]
+		def plugDirtied( plug ) :
+
+			count[0] += 1
+			lastDirtied[0] = plug
+
+		c = n.plugDirtiedSignal().connect( plugDirtied )
 
 		n["p"].setValue( 10 )
 
-		self.assertEqual( len( cs ), 1 )
-		self.assertTrue( cs[0][0].isSame( n["p"] ) )
+		self.assertEqual( count[0], 1 )
+		self.assertTrue( lastDirtied[0].isSame( n["p"] ) )
 
 		n["p"].setValue( 10 )
 
-		self.assertEqual( len( cs ), 1 )
+		self.assertEqual( count[0], 1 )
 
 	def testCopyPasteDoesntRetainComputedValues( self ) :
 
@@ -170,56 +187,42 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 	def testSerialisationOmitsDefaultValues( self ) :
 
-		s = Gaffer.ScriptNode()
+		s = self.__freshScript()
 
 		s["n"] = GafferTest.AddNode()
 		self.assertEqual( s["n"]["op1"].getValue(), s["n"]["op1"].defaultValue() )
 		self.assertEqual( s["n"]["op2"].getValue(), s["n"]["op2"].defaultValue() )
 
-		self.assertFalse( "setValue" in s.serialise() )
-
 		s["n"]["op1"].setValue( 10 )
 
-		self.assertTrue( "[\"op1\"].setValue" in s.serialise() )
+		ss = s.serialise( filter = Gaffer.StandardSet( [ s["n"] ] ) )
+		self.assertTrue( "[\"op1\"].setValue" in ss )
+		self.assertFalse( "[\"op2\"].setValue" in ss )
 
-	def testFloatPlugOmitsDefaultValues( self ) :
-
-		s = Gaffer.ScriptNode()
-
-		s["n"] = Gaffer.Node()
-		s["n"]["f"] = Gaffer.FloatPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
-
-		self.assertFalse( "setValue" in s.serialise() )
-
-		s["n"]["f"].setValue( 10.1 )
-
-		self.assertTrue( "[\"f\"].setValue" in s.serialise() )
-
-	def testBoolPlugOmitsDefaultValues( self ) :
-
-		s = Gaffer.ScriptNode()
+	def testPlugsOmitDefaultValues( self ) :
 
+		s = self.__freshScript()
 		s["n"] = Gaffer.Node()
-		s["n"]["f"] = Gaffer.BoolPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
-
-		self.assertFalse( "setValue" in s.serialise() )
-
-		s["n"]["f"].setValue( True )
 
-		self.assertTrue( "[\"f\"].setValue" in s.serialise() )
+		for plugType, kw, value in [
+			( Gaffer.FloatPlug, {}, 10.1 ),
+			( Gaffer.BoolPlug, {}, True ),
+			( Gaffer.BoolPlug, { "defaultValue" : True }, False ),
+			( Gaffer.IntPlug, {}, 10 ),
+		] :
 
-	def testBoolPlugOmitsDefaultValuesWhenDefaultIsTrue( self ) :
+			s["n"]["f"] = plugType( flags = _dynamicFlags, **kw )
+			s["n"]["g"] = plugType( flags = _dynamicFlags, **kw )
 
-		s = Gaffer.ScriptNode()
-
-		s["n"] = Gaffer.Node()
-		s["n"]["f"] = Gaffer.BoolPlug( defaultValue = True, flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+			s["n"]["f"].setValue( value )
 
-		self.assertFalse( "setValue" in s.serialise() )
+			ss = s.serialise( filter = Gaffer.StandardSet( [ s["n"] ] ) )
+			message = "%s %s %s" % ( plugType.__name__, kw, value )
+			self.assertTrue( "[\"f\"].setValue" in ss, message )
+			self.assertFalse( "[\"g\"].setValue" in ss, message )
 
-		s["n"]["f"].setValue( False )
-
-		self.assertTrue( "[\"f\"].setValue" in s.serialise() )
+			s["n"].removeChild( s["n"]["f"] )
+			s["n"].removeChild( s["n"]["g"] )
 
 	def testCreateCounterpart( self ) :
 
@@ -235,11 +238,11 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 	def testPrecomputedHashOptimisation( self ) :
 
-		n = GafferTest.CachingTestNode()
+		n = self.__cachingTestNode()
 		n["in"].setValue( "a" )
 
 		a1 = n["out"].getValue( _copy = False )
-		self.assertEqual( a1, IECore.StringData( "a" ) )
+		self.assertEqual( a1, _stringDataA )
 		self.assertEqual( n.numHashCalls, 1 )
 
 		# We apply some leeway in our test for how many hash calls are
@@ -247,7 +250,7 @@ class ValuePlugTest( GafferTest.TestCase ) :
 		# unecessary repeated calls in most cases, but it's not
 		# what this unit test is about.
 		a2 = n["out"].getValue( _copy = False )
-		self.assertTrue( a2.isSame( a1 ) )
+		self.assertSame( a2, a1 )
 		self.assertTrue( n.numHashCalls == 1 or n.numHashCalls == 2 )
 
 		h = n["out"].hash()
@@ -258,18 +261,19 @@ class ValuePlugTest( GafferTest.TestCase ) :
 		# definitely doesn't recompute the hash again.
 		a3 = n["out"].getValue( _copy = False, _precomputedHash = h )
 		self.assertEqual( n.numHashCalls, numHashCalls )
-		self.assertTrue( a3.isSame( a1 ) )
+		self.assertSame( a3, a1 )
 
 	def testSerialisationOfChildValues( self ) :
 
-		s = Gaffer.ScriptNode()
+		s = self.__freshScript()
 		s["n"] = Gaffer.Node()
-		s["n"]["user"]["v"] = Gaffer.ValuePlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
-		s["n"]["user"]["v"]["i"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
-		s["n"]["user"]["v"]["i"].setValue( 10 )
+		s["n"]["user"]["v"] = Gaffer.ValuePlug( flags = _dynamicFlags )
+		v = s["n"]["user"]["v"]
+		v["i"] = Gaffer.IntPlug( flags = _dynamicFlags )
+		v["i"].setValue( 10 )
 
 		s2 = Gaffer.ScriptNode()
-		s2.execute( s.serialise() )
+		s2.execute( s.serialise( filter = Gaffer.StandardSet( [ s["n"] ] ) ) )
 
 		self.assertEqual( s2["n"]["user"]["v"]["i"].getValue(), 10 )
 
@@ -288,14 +292,14 @@ class ValuePlugTest( GafferTest.TestCase ) :
 		s.execute( ss )
 
 		self.assertEqual( s["n1"]["p"]["f"].getValue(), 10 )
-		self.failUnless( s["n1"]["p"]["s"].getInput().isSame( s["n2"]["p"]["s"] ) )
+		self.assertTrue( s["n1"]["p"]["s"].getInput().isSame( s["n2"]["p"]["s"] ) )
 
 	def testDynamicSerialisation( self ) :
 
 		s = Gaffer.ScriptNode()
 		s["n1"] = Gaffer.Node()
-		s["n1"]["p"] = Gaffer.ValuePlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
-		s["n1"]["p"]["f"] = Gaffer.FloatPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		s["n1"]["p"] = Gaffer.ValuePlug( flags = _dynamicFlags )
+		s["n1"]["p"]["f"] = Gaffer.FloatPlug( flags = _dynamicFlags )
 		s["n1"]["p"]["f"].setValue( 10 )
 
 		ss = s.serialise()
@@ -321,21 +325,21 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 		n2["c"]["f1"].setInput( n["c"]["f1"] )
 		n2["c"]["f2"].setInput( n["c"]["f2"] )
-		self.failUnless( n2["c"].getInput().isSame( n["c"] ) )
+		self.assertTrue( n2["c"].getInput().isSame( n["c"] ) )
 
 		n2["c"]["f2"].setInput( None )
-		self.failUnless( n2["c"].getInput() is None )
+		self.assertTrue( n2["c"].getInput() is None )
 
 		n2["c"]["f2"].setInput( n["c"]["f2"] )
-		self.failUnless( n2["c"].getInput().isSame( n["c"] ) )
+		self.assertTrue( n2["c"].getInput().isSame( n["c"] ) )
 
 		c["f3"] = Gaffer.FloatPlug()
 		c2["f3"] = Gaffer.FloatPlug()
 
-		self.failUnless( n2["c"].getInput() is None )
+		self.assertTrue( n2["c"].getInput() is None )
 
 		n2["c"]["f3"].setInput( n["c"]["f3"] )
-		self.failUnless( n2["c"].getInput().isSame( n["c"] ) )
+		self.assertTrue( n2["c"].getInput().isSame( n["c"] ) )
 
 	def testInputChangedCrash( self ) :
 
@@ -368,10 +372,10 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 		self.assertEqual( len( dirtyPlugs ), 4 )
 
-		self.failUnless( dirtyPlugs[0][0].isSame( n["p"]["f"] ) )
-		self.failUnless( dirtyPlugs[1][0].isSame( n["p"] ) )
-		self.failUnless( dirtyPlugs[2][0].isSame( n["o"]["f"] ) )
-		self.failUnless( dirtyPlugs[3][0].isSame( n["o"] ) )
+		self.assertTrue( dirtyPlugs[0][0].isSame( n["p"]["f"] ) )
+		self.assertTrue( dirtyPlugs[1][0].isSame( n["p"] ) )
+		self.assertTrue( dirtyPlugs[2][0].isSame( n["o"]["f"] ) )
+		self.assertTrue( dirtyPlugs[3][0].isSame( n["o"] ) )
 
 	def testPlugSetPropagation( self ) :
 
@@ -392,7 +396,7 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 		c["f1"].setValue( 10 )
 
-		self.failUnless( self.set )
+		self.assertTrue( self.set )
 
 	def testMultipleLevelsOfPlugSetPropagation( self ) :
 
@@ -413,7 +417,7 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 		c["c1"]["f1"].setValue( 10 )
 
-		self.failUnless( len( self.setPlugs )==3 )
+		self.assertTrue( len( self.setPlugs )==3 )
 		self.assertEqual( self.setPlugs, [ "f1", "c1", "c" ] )
 
 	def testMultipleLevelsOfPlugSetPropagationWithDifferentParentingOrder( self ) :
@@ -434,10 +438,10 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 		n["c"]["c1"]["f1"].setValue( 10 )
 
-		self.failUnless( len( self.setPlugs )==3 )
-		self.failUnless( "c" in self.setPlugs )
-		self.failUnless( "c1" in self.setPlugs )
-		self.failUnless( "f1" in self.setPlugs )
+		self.assertTrue( len( self.setPlugs )==3 )
+		self.assertTrue( "c" in self.setPlugs )
+		self.assertTrue( "c1" in self.setPlugs )
+		self.assertTrue( "f1" in self.setPlugs )
 
 	def testAcceptsInput( self ) :
 
@@ -448,13 +452,13 @@ class ValuePlugTest( GafferTest.TestCase ) :
 		i.addChild( Gaffer.IntPlug() )
 		o.addChild( Gaffer.IntPlug( direction=Gaffer.Plug.Direction.Out ) )
 
-		self.failUnless( i.acceptsInput( o ) )
-		self.failIf( i.acceptsInput( s ) )
+		self.assertTrue( i.acceptsInput( o ) )
+		self.assertFalse( i.acceptsInput( s ) )
 
 	def testAcceptsNoneInput( self ) :
 
 		p = Gaffer.ValuePlug( "hello" )
-		self.failUnless( p.acceptsInput( None ) )
+		self.assertTrue( p.acceptsInput( None ) )
 
 	def testSerialisationOfMasterConnection( self ) :
 
@@ -463,18 +467,18 @@ class ValuePlugTest( GafferTest.TestCase ) :
 		s["n2"] = GafferTest.CompoundPlugNode()
 
 		s["n1"]["p"].setInput( s["n2"]["p"] )
-		self.failUnless( s["n1"]["p"].getInput().isSame( s["n2"]["p"] ) )
-		self.failUnless( s["n1"]["p"]["f"].getInput().isSame( s["n2"]["p"]["f"] ) )
-		self.failUnless( s["n1"]["p"]["s"].getInput().isSame( s["n2"]["p"]["s"] ) )
+		self.assertTrue( s["n1"]["p"].getInput().isSame( s["n2"]["p"] ) )
+		self.assertTrue( s["n1"]["p"]["f"].getInput().isSame( s["n2"]["p"]["f"] ) )
+		self.assertTrue( s["n1"]["p"]["s"].getInput().isSame( s["n2"]["p"]["s"] ) )
 
 		ss = s.serialise()
 
 		s = Gaffer.ScriptNode()
 		s.execute( ss )
 
-		self.failUnless( s["n1"]["p"].getInput().isSame( s["n2"]["p"] ) )
-		self.failUnless( s["n1"]["p"]["f"].getInput().isSame( s["n2"]["p"]["f"] ) )
-		self.failUnless( s["n1"]["p"]["s"].getInput().isSame( s["n2"]["p"]["s"] ) )
+		self.assertTrue( s["n1"]["p"].getInput().isSame( s["n2"]["p"] ) )
+		self.assertTrue( s["n1"]["p"]["f"].getInput().isSame( s["n2"]["p"]["f"] ) )
+		self.assertTrue( s["n1"]["p"]["s"].getInput().isSame( s["n2"]["p"]["s"] ) )
 
 	def testSetInputShortcut( self ) :
 
@@ -520,15 +524,15 @@ class ValuePlugTest( GafferTest.TestCase ) :
 
 		n["c1"]["i"].setInput( n["c2"]["i1"] )
 
-		self.failUnless( n["c1"]["i"].getInput().isSame( n["c2"]["i1"] ) )
-		self.failUnless( n["c1"].getInput().isSame( n["c2"] ) )
+		self.assertTrue( n["c1"]["i"].getInput().isSame( n["c2"]["i1"] ) )
+		self.assertTrue( n["c1"].getInput().isSame( n["c2"] ) )
 
 	def testSerialisationOfDynamicPlugsOnNondynamicParent( self ) :
 
 		s = Gaffer.ScriptNode()
 		s["n"] = GafferTest.CompoundPlugNode()
 
-		s["n"]["nonDynamicParent"]["dynamicPlug"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		s["n"]["nonDynamicParent"]["dynamicPlug"] = Gaffer.IntPlug( flags = _dynamicFlags )
 		s["n"]["nonDynamicParent"]["dynamicPlug"].setValue( 10 )
 
 		s2 = Gaffer.ScriptNode()
@@ -602,7 +606,7 @@ class ValuePlugTest( GafferTest.TestCase ) :
 		n = Gaffer.Node()
 		n["p"] = p
 
-		self.failUnless( n["p"] is p )
+		self.assertTrue( n["p"] is p )
 
 	def testNullInputPropagatesToChildren( self ) :
 
@@ -685,17 +689,79 @@ class ValuePlugTest( GafferTest.TestCase ) :
 		with Gaffer.Context( s.context(), canceller ) :
 			self.assertEqual( s["n"]["sum"].getValue(), 40 )
 
-	def setUp( self ) :
+	@classmethod
+	def setUpClass( cls ) :
+
+		GafferTest.TestCase.setUpClass()
+
+		# Constructing a ScriptNode is relatively expensive, so the
+		# serialisation tests share a single one, which is emptied
+		# before each use.
+		cls.__script = Gaffer.ScriptNode()
+
+	@classmethod
+	def tearDownClass( cls ) :
+
+		GafferTest.TestCase.tearDownClass()
+
+		del cls.__script
+		cls.__cachingNode = None
+		cls.__cachingTestPlugs = None
+
+	# Building the CachingTestNode and the chain of plugs downstream of
+	# it is relatively expensive, so they are shared between tests and
+	# reset each time they are reused.
+	__cachingNode = None
+	__cachingTestPlugs = None
+
+	def __cachingTestNode( self ) :
+
+		cls = self.__class__
+		if cls.__cachingNode is None :
+
+			cls.__cachingNode = GafferTest.CachingTestNode()
+
+			p1 = Gaffer.ObjectPlug( "p1", Gaffer.Plug.Direction.In, IECore.IntData( 10 ) )
+			p2 = Gaffer.ObjectPlug( "p2", Gaffer.Plug.Direction.In, IECore.IntData( 20 ) )
+			p3 = Gaffer.ObjectPlug( "p3", Gaffer.Plug.Direction.In, IECore.IntData( 30 ) )
+
+			# Connect from the upstream end first, so that each new
+			# connection has nothing downstream of it to dirty.
+			p1.setInput( cls.__cachingNode["out"] )
+			p2.setInput( p1 )
+			p3.setInput( p2 )
+
+			cls.__cachingTestPlugs = ( p1, p2, p3 )
+
+		# Start from a known input, so that the value set by each test
+		# is guaranteed to dirty the output and invalidate any hashes
+		# cached by a previous test.
+		cls.__cachingNode["in"].setToDefault()
+		cls.__cachingNode.numHashCalls = 0
+		return cls.__cachingNode
+
+	def assertSame( self, a, b ) :
+
+		self.assertTrue( a.isSame( b ) )
+
+	def assertNotSame( self, a, b ) :
+
+		self.assertFalse( a.isSame( b ) )
+
+	def __freshScript( self ) :
 
-		GafferTest.TestCase.setUp( self )
+		s = self.__script
+		for node in s.children( Gaffer.Node ) :
+			s.removeChild( node )
 
-		self.__originalCacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		return s
 
 	def tearDown( self ) :
 
 		GafferTest.TestCase.tearDown( self )
 
-		Gaffer.ValuePlug.setCacheMemoryLimit( self.__originalCacheMemoryLimit )
+		if self.__cachingNode is not None :
+			self.__cachingNode["out"].setFlags( Gaffer.Plug.Flags.Cacheable, True )
 
 if __name__ == "__main__":
 	unittest.main()
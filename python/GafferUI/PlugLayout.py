@@ -36,8 +36,6 @@
 ##########################################################################
 
 import re
-import sys
-import functools
 import collections
 
 import Gaffer
@@ -45,6 +43,14 @@ import GafferUI
 
 from Qt import QtWidgets
 
+# Matches the remainder of a "<layoutName>:customWidget:Name:widgetType"
+# metadata name, following the "<layoutName>:customWidget:" prefix.
+_customWidgetTypeRegex = re.compile( "(.+):widgetType" )
+
+# Cache of the classes that `widgetType` metadata resolves to, keyed by the
+# dotted path. There is only ever a handful of these, so the cache is unbounded.
+_widgetClassCache = {}
+
 ## A class for laying out widgets to represent all the plugs held on a particular parent.
 #
 # Per-plug metadata support :
@@ -97,7 +103,8 @@ class PlugLayout( GafferUI.Widget ) :
 		# which affects how the widget is built
 		self.__embedded = embedded
 
-		self.__layout = _TabLayout( orientation, embedded = embedded ) if isinstance( parent, Gaffer.Node ) and not rootSection else _CollapsibleLayout( orientation )
+		self.__parentIsNode = isinstance( parent, Gaffer.Node )
+		self.__layout = _TabLayout( orientation, embedded = embedded ) if self.__parentIsNode and not rootSection else _CollapsibleLayout( orientation )
 
 		GafferUI.Widget.__init__( self, self.__layout, **kw )
 
@@ -113,12 +120,27 @@ class PlugLayout( GafferUI.Widget ) :
 		parent.childRemovedSignal().connect( Gaffer.WeakMethod( self.__childAddedOrRemoved ), scoped = False )
 
 		# since our layout is driven by metadata, we must respond dynamically
-		# to changes in that metadata.
-		Gaffer.Metadata.plugValueChangedSignal().connect( Gaffer.WeakMethod( self.__plugMetadataChanged ), scoped = False )
+		# to changes in that metadata. we're only interested in a few keys, so
+		# we prepare to check them quickly.
+		self.__layoutMetadataKeys = frozenset( (
+			"divider",
+			layoutName + ":divider",
+			layoutName + ":index",
+			layoutName + ":section",
+			layoutName + ":accessory",
+			"plugValueWidget:type"
+		) )
+		self.__summaryMetadataRegex = re.compile( layoutName + ":section:.*:summary" )
+		plugMetadataChangedConnection = Gaffer.Metadata.plugValueChangedSignal().connect( Gaffer.WeakMethod( self.__plugMetadataChanged ), scoped = False )
 
 		# and since our activations are driven by plug values, we must respond
 		# when the plugs are dirtied.
-		self.__node().plugDirtiedSignal().connect( Gaffer.WeakMethod( self.__plugDirtied ), scoped = False )
+		plugDirtiedConnection = self.__node().plugDirtiedSignal().connect( Gaffer.WeakMethod( self.__plugDirtied ), scoped = False )
+
+		# we block these while updating, as we'll be recomputing everything
+		# from scratch anyway, and don't want to schedule further updates in
+		# response to our own work.
+		self.__updateBlockedConnections = [ plugMetadataChangedConnection, plugDirtiedConnection ]
 
 		# frequently events that trigger a ui update come in batches, so we
 		# perform the update lazily using a LazyMethod. the dirty variables
@@ -126,12 +148,19 @@ class PlugLayout( GafferUI.Widget ) :
 		self.__layoutDirty = True
 		self.__activationsDirty = True
 		self.__summariesDirty = True
+		# true while a call to `__updateLazily()` made by one of our
+		# frequently emitted signal handlers is still waiting to run.
+		self.__updatePending = False
 
 		# mapping from layout item to widget, where the key is either a plug or
 		# the name of a custom widget (as returned by layoutOrder()).
 		self.__widgets = {}
 		self.__rootSection = _Section( self.__parent )
 
+		# cache of item metadata values, used during `__update()` to
+		# avoid querying the same values repeatedly.
+		self.__metadataCache = None
+
 		# set up an appropriate default context in which to view the plugs.
 		scriptNode = self.__node() if isinstance( self.__node(), Gaffer.ScriptNode ) else self.__node().scriptNode()
 		self.setContext( scriptNode.context() if scriptNode is not None else self.__fallbackContext )
@@ -199,9 +228,11 @@ class PlugLayout( GafferUI.Widget ) :
 	@classmethod
 	def layoutSections( cls, parent, includeCustomWidgets = False, layoutName = "layout" ) :
 
+		metadataCache = {}
+		parentIsNode = isinstance( parent, Gaffer.Node )
 		d = collections.OrderedDict()
-		for item in cls.layoutOrder( parent, includeCustomWidgets, layoutName = layoutName ) :
-			sectionPath = cls.__staticSectionPath( item, parent, layoutName )
+		for item in cls.layoutOrder( parent, includeCustomWidgets, layoutName = layoutName, _metadataCache = metadataCache ) :
+			sectionPath = cls.__staticSectionPath( item, parent, layoutName, metadataCache, parentIsNode )
 			sectionName = ".".join( sectionPath )
 			d[sectionName] = 1
 
@@ -214,89 +245,125 @@ class PlugLayout( GafferUI.Widget ) :
 	# strings within the list. If a section name is specified, then the
 	# result will be filtered to include only items in that section.
 	@classmethod
-	def layoutOrder( cls, parent, includeCustomWidgets = False, section = None, layoutName = "layout", rootSection = "" ) :
+	def layoutOrder( cls, parent, includeCustomWidgets = False, section = None, layoutName = "layout", rootSection = "", _metadataCache = None ) :
 
 		items = parent.children( Gaffer.Plug )
 		items = [ plug for plug in items if not plug.getName().startswith( "__" ) ]
 
 		if includeCustomWidgets :
+			prefix = layoutName + ":customWidget:"
 			for name in Gaffer.Metadata.registeredValues( parent ) :
-				m = re.match( layoutName + ":customWidget:(.+):widgetType", name )
+				if not name.startswith( prefix ) :
+					continue
+				m = _customWidgetTypeRegex.match( name, len( prefix ) )
 				if m and cls.__metadataValue( parent, name ) :
 					items.append( m.group( 1 ) )
 
-		itemsAndIndices = [ list( x ) for x in enumerate( items ) ]
-		for itemAndIndex in itemsAndIndices :
-			index = cls.__staticItemMetadataValue( itemAndIndex[1], "index", parent, layoutName )
-			if index is not None :
-				index = index if index >= 0 else sys.maxsize + index
-				itemAndIndex[0] = index
+		# Items are sorted by their "index" metadata where it exists, and by
+		# their original position otherwise. Negative indices count back from
+		# the end, so they sort after everything else.
+		sortKeys = {}
+		for position, item in enumerate( items ) :
+			index = cls.__staticItemMetadataValue( item, "index", parent, layoutName, _metadataCache )
+			if index is None :
+				sortKeys[item] = ( 0, position )
+			else :
+				sortKeys[item] = ( 0, index ) if index >= 0 else ( 1, index )
+
+		items.sort( key = sortKeys.__getitem__ )
 
-		itemsAndIndices.sort( key = lambda x : x[0] )
+		parentIsNode = isinstance( parent, Gaffer.Node )
 
 		if section is not None :
 			sectionPath = section.split( "." ) if section else []
-			itemsAndIndices = [ x for x in itemsAndIndices if cls.__staticSectionPath( x[1], parent, layoutName ) == sectionPath ]
+			items = [ x for x in items if cls.__staticSectionPath( x, parent, layoutName, _metadataCache, parentIsNode ) == sectionPath ]
 
 		if rootSection :
 			rootSectionPath = rootSection.split( "." if rootSection else [] )
-			itemsAndIndices = [ x for x in itemsAndIndices if cls.__staticSectionPath( x[1], parent, layoutName )[:len(rootSectionPath)] == rootSectionPath ]
+			items = [ x for x in items if cls.__staticSectionPath( x, parent, layoutName, _metadataCache, parentIsNode )[:len(rootSectionPath)] == rootSectionPath ]
 
-		return [ x[1] for x in itemsAndIndices ]
+		return items
 
 	@GafferUI.LazyMethod()
 	def __updateLazily( self ) :
 
 		self.__update()
 
+	# Typically we receive many notifications in a row, and once an
+	# update is pending there is nothing more to do for the rest of them.
+	def __scheduleUpdate( self ) :
+
+		if self.__updatePending :
+			return
+
+		self.__updatePending = True
+		self.__updateLazily()
+
 	def __update( self ) :
 
-		if self.__layoutDirty :
-			self.__updateLayout()
-			self.__layoutDirty = False
+		# LazyMethod has dequeued our call by the time we get here, so
+		# further notifications must schedule another, even if this
+		# update fails.
+		self.__updatePending = False
+
+		with Gaffer.BlockedConnection( self.__updateBlockedConnections ) :
 
-		if self.__activationsDirty :
-			self.__updateActivations()
-			self.__activationsDirty = False
+			self.__metadataCache = {}
+			try :
 
-		if self.__summariesDirty :
-			self.__updateSummariesWalk( self.__rootSection )
-			self.__summariesDirty = False
+				if self.__layoutDirty :
+					self.__updateLayout()
+					self.__layoutDirty = False
 
-		# delegate to our layout class to create a concrete
-		# layout from the section definitions.
+				if self.__activationsDirty :
+					self.__updateActivations()
+					self.__activationsDirty = False
 
-		self.__layout.update( self.__rootSection )
+				if self.__summariesDirty :
+					self.__updateSummaries()
+					self.__summariesDirty = False
+
+			finally :
+
+				self.__metadataCache = None
+
+			# delegate to our layout class to create a concrete
+			# layout from the section definitions.
+
+			self.__layout.update( self.__rootSection )
 
 	def __updateLayout( self ) :
 
 		# get the items to lay out - these are a combination
 		# of plugs and strings representing custom widgets.
-		items = self.layoutOrder( self.__parent, includeCustomWidgets = True, layoutName = self.__layoutName, rootSection = self.__rootSectionName )
+		items = self.layoutOrder( self.__parent, includeCustomWidgets = True, layoutName = self.__layoutName, rootSection = self.__rootSectionName, _metadataCache = self.__metadataCache )
 
-		# ditch widgets we don't need any more
+		# ditch widgets we don't need any more, and widgets whose
+		# metadata type has changed - we must recreate these.
 
 		itemsSet = set( items )
-		self.__widgets = { k : v for k, v in self.__widgets.items() if k in itemsSet }
-
-		# ditch widgets whose metadata type has changed - we must recreate these.
-		self.__widgets = {
-			k : v for k, v in self.__widgets.items()
-			if isinstance( k, str ) or v is not None and Gaffer.Metadata.value( k, "plugValueWidget:type" ) == v.__plugValueWidgetType
-		}
-
+		for k, v in list( self.__widgets.items() ) :
+			if k not in itemsSet :
+				del self.__widgets[k]
+			elif not isinstance( k, str ) and ( v is None or self.__cachedPlugValueWidgetType( k ) != v.__plugValueWidgetType ) :
+				del self.__widgets[k]
 
 		# make (or reuse existing) widgets for each item, and sort them into
 		# sections.
 		rootSectionDepth = self.__rootSectionName.count( "." ) + 1 if self.__rootSectionName else 0
+		dividerOrientation = GafferUI.Divider.Orientation.Horizontal if self.__layout.orientation() == GafferUI.ListContainer.Orientation.Vertical else GafferUI.Divider.Orientation.Vertical
 		self.__rootSection.clear()
+		# Many items typically share the same few sections, so we
+		# remember the section for each path rather than walking
+		# down from the root every time.
+		sections = {}
 		for item in items :
 
 			if item not in self.__widgets :
-				if isinstance( item, Gaffer.Plug ) :
-					widget = self.__createPlugWidget( item )
-				else :
+				if isinstance( item, str ) :
 					widget = self.__createCustomWidget( item )
+				else :
+					widget = self.__createPlugWidget( item )
 				self.__widgets[item] = widget
 			else :
 				widget = self.__widgets[item]
@@ -304,9 +371,13 @@ class PlugLayout( GafferUI.Widget ) :
 			if widget is None :
 				continue
 
-			section = self.__rootSection
-			for sectionName in self.__sectionPath( item )[rootSectionDepth:] :
-				section = section.subsection( sectionName )
+			sectionPath = tuple( self.__sectionPath( item )[rootSectionDepth:] )
+			section = sections.get( sectionPath )
+			if section is None :
+				section = self.__rootSection
+				for sectionName in sectionPath :
+					section = section.subsection( sectionName )
+				sections[sectionPath] = section
 
 			if len( section.widgets ) and self.__itemMetadataValue( item, "accessory" ) :
 				if isinstance( section.widgets[-1], _AccessoryRow ) :
@@ -320,18 +391,18 @@ class PlugLayout( GafferUI.Widget ) :
 				section.widgets.append( widget )
 
 			if self.__itemMetadataValue( item, "divider" ) :
-				section.widgets.append( GafferUI.Divider(
-					GafferUI.Divider.Orientation.Horizontal if self.__layout.orientation() == GafferUI.ListContainer.Orientation.Vertical else GafferUI.Divider.Orientation.Vertical
-				) )
+				section.widgets.append( GafferUI.Divider( dividerOrientation ) )
 
 	def __updateActivations( self ) :
 
 		with self.getContext() :
 			# Must scope the context when getting activators, because they are typically
 			# computed from the plug values, and may therefore trigger a compute.
-			activators = self.__metadataValue( self.__parent, self.__layoutName + ":activators" ) or {}
+			activatorsData = self.__metadataValue( self.__parent, self.__layoutName + ":activators" ) or {}
 
-		activators = { k : v.value for k, v in activators.items() } # convert CompoundData of BoolData to dict of booleans
+		# cache of activator values, converted from activatorsData or computed
+		# individually only when first needed.
+		activators = {}
 
 		def active( activatorName ) :
 
@@ -339,9 +410,12 @@ class PlugLayout( GafferUI.Widget ) :
 			if activatorName :
 				result = activators.get( activatorName )
 				if result is None :
-					with self.getContext() :
-						result = self.__metadataValue( self.__parent, self.__layoutName + ":activator:" + activatorName )
-					result = result if result is not None else False
+					if activatorName in activatorsData :
+						result = activatorsData[activatorName].value
+					else :
+						with self.getContext() :
+							result = self.__metadataValue( self.__parent, self.__layoutName + ":activator:" + activatorName )
+						result = result if result is not None else False
 					activators[activatorName] = result
 
 			return result
@@ -351,24 +425,45 @@ class PlugLayout( GafferUI.Widget ) :
 				widget.setEnabled( active( self.__itemMetadataValue( item, "activator" ) ) )
 				widget.setVisible( active( self.__itemMetadataValue( item, "visibilityActivator" ) ) )
 
-	def __updateSummariesWalk( self, section ) :
-
+	def __updateSummaries( self ) :
+
+		sections = {}
+		stack = [ self.__rootSection ]
+		while stack :
+			section = stack.pop()
+			section.summary = ""
+			sections[section.fullName] = section
+			stack.extend( section.subsections.values() )
+
+		# Rather than query a summary for every section, we find the
+		# summaries that are actually registered and only evaluate
+		# those.
+		prefix = self.__layoutName + ":section:"
+		suffix = ":summary"
 		with self.getContext() :
 			# Must scope the context because summaries are typically
 			# generated from plug values, and may therefore trigger
 			# a compute.
-			section.summary = self.__metadataValue( self.__parent, self.__layoutName + ":section:" + section.fullName + ":summary" ) or ""
+			for name in Gaffer.Metadata.registeredValues( self.__parent ) :
+				if len( name ) < len( prefix ) + len( suffix ) or not name.startswith( prefix ) or not name.endswith( suffix ) :
+					continue
+				section = sections.pop( name[len(prefix):-len(suffix)], None )
+				if section is not None :
+					section.summary = self.__metadataValue( self.__parent, name ) or ""
 
-		for subsection in section.subsections.values() :
-			self.__updateSummariesWalk( subsection )
+	@staticmethod
+	def __import( path ) :
 
-	def __import( self, path ) :
+		result = _widgetClassCache.get( path )
+		if result is not None :
+			return result
 
-		path = path.split( "." )
-		result = __import__( path[0] )
-		for n in path[1:] :
+		names = path.split( "." )
+		result = __import__( names[0] )
+		for n in names[1:] :
 			result = getattr( result, n )
 
+		_widgetClassCache[path] = result
 		return result
 
  	def __createPlugWidget( self, plug ) :
@@ -398,7 +493,7 @@ class PlugLayout( GafferUI.Widget ) :
 
 		# Store the metadata value that controlled the type created, so we can compare to it
 		# in the future to determine if we can reuse the widget.
-		result.__plugValueWidgetType = Gaffer.Metadata.value( plug, "plugValueWidget:type" )
+		result.__plugValueWidgetType = self.__cachedPlugValueWidgetType( plug )
 
  		return result
 
@@ -414,7 +509,7 @@ class PlugLayout( GafferUI.Widget ) :
 
 	def __node( self ) :
 
-		return self.__parent if isinstance( self.__parent, Gaffer.Node ) else self.__parent.node()
+		return self.__parent if self.__parentIsNode else self.__parent.node()
 
 	@classmethod
 	def __metadataValue( cls, plugOrNode, name ) :
@@ -422,40 +517,61 @@ class PlugLayout( GafferUI.Widget ) :
 		return Gaffer.Metadata.value( plugOrNode, name )
 
 	@classmethod
-	def __staticItemMetadataValue( cls, item, name, parent, layoutName ) :
+	def __staticItemMetadataValue( cls, item, name, parent, layoutName, metadataCache = None ) :
 
-		if isinstance( item, Gaffer.Plug ) :
+		if metadataCache is not None :
+			key = ( item, name )
+			if key not in metadataCache :
+				metadataCache[key] = cls.__staticItemMetadataValue( item, name, parent, layoutName )
+			return metadataCache[key]
+
+		# Items are either plugs or the names of custom widgets, and testing
+		# for a string is cheaper than testing for a Plug.
+		if isinstance( item, str ) :
+			return cls.__metadataValue( parent, layoutName + ":customWidget:" + item + ":" + name )
+		else :
 			v = Gaffer.Metadata.value( item, layoutName + ":" + name )
 			if v is None and name in ( "divider", "label" ) :
 				# Backwards compatibility with old unprefixed metadata names.
 				v = Gaffer.Metadata.value( item, name )
 			return v
-		else :
-			return cls.__metadataValue( parent, layoutName + ":customWidget:" + item + ":" + name )
 
 	def __itemMetadataValue( self, item, name ) :
 
-		return self.__staticItemMetadataValue( item, name, parent = self.__parent, layoutName = self.__layoutName )
+		return self.__staticItemMetadataValue( item, name, parent = self.__parent, layoutName = self.__layoutName, metadataCache = self.__metadataCache )
+
+	def __cachedPlugValueWidgetType( self, plug ) :
+
+		if self.__metadataCache is None :
+			return Gaffer.Metadata.value( plug, "plugValueWidget:type" )
+
+		key = ( plug, "plugValueWidget:type" )
+		if key not in self.__metadataCache :
+			self.__metadataCache[key] = Gaffer.Metadata.value( plug, "plugValueWidget:type" )
+		return self.__metadataCache[key]
 
 	@classmethod
-	def __staticSectionPath( cls, item, parent, layoutName ) :
+	def __staticSectionPath( cls, item, parent, layoutName, metadataCache = None, parentIsNode = None ) :
+
+		if parentIsNode is None :
+			parentIsNode = isinstance( parent, Gaffer.Node )
 
 		m = None
-		if isinstance( parent, Gaffer.Node ) :
+		if parentIsNode :
 			# Backwards compatibility with old metadata entry
 			## \todo Remove
-			m = cls.__staticItemMetadataValue( item, "nodeUI:section", parent, layoutName )
+			m = cls.__staticItemMetadataValue( item, "nodeUI:section", parent, layoutName, metadataCache )
 			if m == "header" :
 				m = ""
 
 		if m is None :
-			m = cls.__staticItemMetadataValue( item, "section", parent, layoutName )
+			m = cls.__staticItemMetadataValue( item, "section", parent, layoutName, metadataCache )
 
 		return m.split( "." ) if m else []
 
 	def __sectionPath( self, item ) :
 
-		return self.__staticSectionPath( item, parent = self.__parent, layoutName = self.__layoutName )
+		return self.__staticSectionPath( item, parent = self.__parent, layoutName = self.__layoutName, metadataCache = self.__metadataCache, parentIsNode = self.__parentIsNode )
 
 	def __childAddedOrRemoved( self, *unusedArgs ) :
 
@@ -463,7 +579,7 @@ class PlugLayout( GafferUI.Widget ) :
 		# we do a lazy update so we can batch up several changes into one.
 		# upheaval is over.
 		self.__layoutDirty = True
-		self.__updateLazily()
+		self.__scheduleUpdate()
 
 	def __applyReadOnly( self, widget, readOnly ) :
 
@@ -490,26 +606,25 @@ class PlugLayout( GafferUI.Widget ) :
 
 	def __plugMetadataChanged( self, nodeTypeId, plugPath, key, plug ) :
 
-		parentAffected = isinstance( self.__parent, Gaffer.Plug ) and Gaffer.MetadataAlgo.affectedByChange( self.__parent, nodeTypeId, plugPath, plug )
+		# check the key first, because it rules out most changes and is
+		# much cheaper than checking whether or not we're affected.
+		layoutChanged = key in self.__layoutMetadataKeys
+		if not layoutChanged and not self.__summaryMetadataRegex.match( key ) :
+			return
+
+		parentAffected = not self.__parentIsNode and Gaffer.MetadataAlgo.affectedByChange( self.__parent, nodeTypeId, plugPath, plug )
 		childAffected = Gaffer.MetadataAlgo.childAffectedByChange( self.__parent, nodeTypeId, plugPath, plug )
 		if not parentAffected and not childAffected :
 			return
 
-		if key in (
-			"divider",
-			self.__layoutName + ":divider",
-			self.__layoutName + ":index",
-			self.__layoutName + ":section",
-			self.__layoutName + ":accessory",
-			"plugValueWidget:type"
-		) :
+		if layoutChanged :
 			# we often see sequences of several metadata changes - so
 			# we schedule a lazy update to batch them into one ui update.
 			self.__layoutDirty = True
-			self.__updateLazily()
-		elif re.match( self.__layoutName + ":section:.*:summary", key ) :
+		else :
 			self.__summariesDirty = True
-			self.__updateLazily()
+
+		self.__updateLazily()
 
 	def __plugDirtied( self, plug ) :
 
@@ -518,7 +633,7 @@ class PlugLayout( GafferUI.Widget ) :
 
 		self.__activationsDirty = True
 		self.__summariesDirty = True
-		self.__updateLazily()
+		self.__scheduleUpdate()
 
 	def __contextChanged( self, context, name ) :
 
@@ -526,7 +641,6 @@ class PlugLayout( GafferUI.Widget ) :
 		self.__summariesDirty = True
 		self.__updateLazily()
 
-
 class _AccessoryRow( GafferUI.ListContainer ) :
 
 	def __init__( self, **kw ) :
@@ -538,6 +652,10 @@ class _AccessoryRow( GafferUI.ListContainer ) :
 # and an OrderedDict of named subsections.
 class _Section( object ) :
 
+	# Many sections may be created for large layouts, so we avoid the
+	# overhead of a per-instance __dict__.
+	__slots__ = ( "__parent", "fullName", "widgets", "subsections", "summary" )
+
 	def __init__( self, _parent, _fullName = "" ) :
 
 		self.__parent = _parent
@@ -547,9 +665,10 @@ class _Section( object ) :
 
 	def subsection( self, name ) :
 
-		result = self.subsections.get( name )
-		if result is not None :
-			return result
+		try :
+			return self.subsections[name]
+		except KeyError :
+			pass
 
 		result = _Section(
 			self.__parent,
@@ -622,14 +741,20 @@ class _TabLayout( _Layout ) :
 			Gaffer.WeakMethod( self.__currentTabChanged )
 		)
 
+		# mapping from name to tab, in the order the tabs
+		# appear in the tabbed container.
+		self.__tabs = collections.OrderedDict()
+
 	def update( self, section ) :
 
 		self.__section = section
 		self.__widgetsColumn[:] = section.widgets
 
-		existingTabs = collections.OrderedDict()
-		for tab in self.__tabbedContainer[:] :
-			existingTabs[self.__tabbedContainer.getLabel( tab )] = tab
+		existingTabs = self.__tabs
+
+		orientation = self.orientation()
+		isVertical = orientation == GafferUI.ListContainer.Orientation.Vertical
+		scrollModeNever = GafferUI.ScrollMode.Never
 
 		updatedTabs = collections.OrderedDict()
 		for name, subsection in section.subsections.items() :
@@ -640,21 +765,25 @@ class _TabLayout( _Layout ) :
 					tab = GafferUI.Frame( borderWidth = 0, borderStyle = GafferUI.Frame.BorderStyle.None )
 				else :
 					tab = GafferUI.ScrolledContainer( borderWidth = 8 )
-					if self.orientation() == GafferUI.ListContainer.Orientation.Vertical :
-						tab.setHorizontalMode( GafferUI.ScrollMode.Never )
+					if isVertical :
+						tab.setHorizontalMode( scrollModeNever )
 					else :
-						tab.setVerticalMode( GafferUI.ScrollMode.Never )
+						tab.setVerticalMode( scrollModeNever )
 
-				tab.setChild( _CollapsibleLayout( self.orientation() ) )
+				tab.setChild( _CollapsibleLayout( orientation ) )
 			tab.getChild().update( subsection )
 			updatedTabs[name] = tab
 
-		if existingTabs.keys() != updatedTabs.keys() :
+		# the tabs are usually unchanged, in which case we can
+		# avoid rebuilding the tabbed container.
+		if tuple( existingTabs.keys() ) != tuple( updatedTabs.keys() ) :
 			with Gaffer.BlockedConnection( self.__currentTabChangedConnection ) :
 				del self.__tabbedContainer[:]
 				for name, tab in updatedTabs.items() :
 					self.__tabbedContainer.append( tab, label = name )
 
+		self.__tabs = updatedTabs
+
 		for index, subsection in enumerate( section.subsections.values() ) :
 			## \todo Consider how/if we should add a public tooltip API to TabbedContainer.
 			self.__tabbedContainer._qtWidget().setTabToolTip( index, subsection.summary )
@@ -683,9 +812,11 @@ class _CollapsibleLayout( _Layout ) :
 
 	def update( self, section ) :
 
-		widgets = list( section.widgets )
+		numWidgets = len( section.widgets )
+		widgets = [ None ] * ( numWidgets + len( section.subsections ) )
+		widgets[:numWidgets] = section.widgets
 
-		for name, subsection in section.subsections.items() :
+		for index, ( name, subsection ) in enumerate( section.subsections.items(), numWidgets ) :
 
 			collapsible = self.__collapsibles.get( name )
 			if collapsible is None :
@@ -708,7 +839,7 @@ class _CollapsibleLayout( _Layout ) :
 					collapsible.setCollapsed( False )
 
 				collapsible.stateChangedSignal().connect(
-					functools.partial( Gaffer.WeakMethod( self.__collapsibleStateChanged ), subsection = subsection ),
+					self.__collapsibleStateChangedSlot( subsection ),
 					scoped = False
 				)
 
@@ -719,10 +850,18 @@ class _CollapsibleLayout( _Layout ) :
 				"<small>" + "&nbsp;( " + subsection.summary + " )</small>" if subsection.summary else ""
 			)
 
-			widgets.append( collapsible )
+			widgets[index] = collapsible
 
 		self.__column[:] = widgets
 
+	# Returns a slot for `Collapsible.stateChangedSignal()`, which calls
+	# `__collapsibleStateChanged()` for the specified subsection without
+	# keeping us alive.
+	def __collapsibleStateChangedSlot( self, subsection ) :
+
+		weakMethod = Gaffer.WeakMethod( self.__collapsibleStateChanged )
+		return lambda collapsible : weakMethod( collapsible, subsection )
+
 	def __collapsibleStateChanged( self, collapsible, subsection ) :
 
 		subsection.saveState( "collapsed", collapsible.getCollapsed() )
@@ -132,6 +132,37 @@ class PlugLayoutTest( GafferUITest.TestCase ) :
 		Gaffer.Metadata.registerValue( n["user"]["a"], "layout:index", 3 )
 		self.assertEqual( GafferUI.PlugLayout.layoutSections( n["user"] ), [ "B", "C", "A" ] )
 
+	def testSectionQueriesTrackChildren( self ) :
+
+		n = Gaffer.Node()
+		n["user"]["a"] = Gaffer.IntPlug()
+		Gaffer.Metadata.registerValue( n["user"]["a"], "layout:section", "A" )
+
+		self.assertEqual( GafferUI.PlugLayout.layoutSections( n["user"] ), [ "A" ] )
+
+		n["user"]["b"] = Gaffer.IntPlug()
+		self.assertEqual( GafferUI.PlugLayout.layoutSections( n["user"] ), [ "A", "" ] )
+
+		del n["user"]["a"]
+		self.assertEqual( GafferUI.PlugLayout.layoutSections( n["user"] ), [ "" ] )
+
+	def testSectionQueriesTrackRenames( self ) :
+
+		n = Gaffer.Node()
+		n["user"]["a"] = Gaffer.IntPlug()
+		n["user"]["b"] = Gaffer.IntPlug()
+		Gaffer.Metadata.registerValue( n["user"]["a"], "layout:section", "A" )
+
+		self.assertEqual( GafferUI.PlugLayout.layoutSections( n["user"] ), [ "A", "" ] )
+
+		# Plugs prefixed with "__" are not laid out.
+
+		n["user"]["a"].setName( "__a" )
+		self.assertEqual( GafferUI.PlugLayout.layoutSections( n["user"] ), [ "" ] )
+
+		n["user"]["__a"].setName( "a" )
+		self.assertEqual( GafferUI.PlugLayout.layoutSections( n["user"] ), [ "A", "" ] )
+
 	def testLayoutOrderSectionArgument( self ) :
 
 		n = Gaffer.Node()
@@ -267,6 +298,23 @@ class PlugLayoutTest( GafferUITest.TestCase ) :
 		p["value"].setValue( True )
 		self.assertEqual( l.plugValueWidget( s["n"]["s"], lazy = False ).enabled(), True )
 
+	def testUpdatesRecoverFromErrors( self ) :
+
+		n = Gaffer.Node()
+		n["a"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		Gaffer.Metadata.registerValue( n, "layout:customWidget:bad:widgetType", "GafferUITest.NonExistentWidget" )
+
+		l = GafferUI.PlugLayout( n )
+		with self.assertRaises( AttributeError ) :
+			l.plugValueWidget( n["a"], lazy = False )
+
+		# Once the error is fixed, further changes must still
+		# update the layout.
+
+		Gaffer.Metadata.deregisterValue( n, "layout:customWidget:bad:widgetType" )
+		n["b"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		self.assertTrue( l.plugValueWidget( n["b"], lazy = False ) is not None )
+
 	def testMultipleLayouts( self ) :
 
 		n = Gaffer.Node()
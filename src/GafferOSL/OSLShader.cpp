@@ -58,9 +58,12 @@
 #include "OSL/oslquery.h"
 
 #include "boost/algorithm/string/predicate.hpp"
+#include "boost/functional/hash.hpp"
 
 #include "tbb/mutex.h"
 
+#include <memory>
+
 using namespace std;
 using namespace Imath;
 using namespace IECore;
@@ -70,6 +73,62 @@ using namespace Gaffer;
 using namespace GafferScene;
 using namespace GafferOSL;
 
+//////////////////////////////////////////////////////////////////////////
+// LRUCache of OSLQueries
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Opening an OSLQuery means reading and parsing the `.oso` file from disk,
+// so we cache the results to avoid doing it every time a shader is loaded.
+// The result depends on the search path as well as the shader name, so
+// both are used in the key.
+typedef std::shared_ptr<const OSLQuery> ConstOSLQueryPtr;
+typedef std::pair<std::string, std::string> QueryCacheKey; // ( searchPath, shaderName )
+
+QueryCacheKey queryCacheKey( const std::string &shaderName )
+{
+	const char *searchPath = getenv( "OSL_SHADER_PATHS" );
+	return QueryCacheKey( searchPath ? searchPath : "", shaderName );
+}
+
+ConstOSLQueryPtr queryGetter( const QueryCacheKey &key, size_t &cost )
+{
+	cost = 1;
+
+	std::shared_ptr<OSLQuery> query = std::make_shared<OSLQuery>();
+	if( !query->open( key.second, key.first ) )
+	{
+		throw Exception( query->geterror() );
+	}
+
+	return query;
+}
+
+typedef IECorePreview::LRUCache<QueryCacheKey, ConstOSLQueryPtr> QueryCache;
+QueryCache g_queryCache( queryGetter, 10000 );
+
+// Returns the query for the specified shader, throwing if it can't be
+// opened. The LRUCache would otherwise keep rethrowing a failure, so we
+// remove failed entries to allow the load to be retried once the shader
+// has been compiled or the search path fixed.
+ConstOSLQueryPtr shaderQuery( const std::string &shaderName )
+{
+	const QueryCacheKey key = queryCacheKey( shaderName );
+	try
+	{
+		return g_queryCache.get( key );
+	}
+	catch( ... )
+	{
+		g_queryCache.erase( key );
+		throw;
+	}
+}
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // LRUCache of ShadingEngines
 //////////////////////////////////////////////////////////////////////////
@@ -997,13 +1056,8 @@ void OSLShader::loadShader( const std::string &shaderName, bool keepExistingValu
 		return;
 	}
 
-	const char *searchPath = getenv( "OSL_SHADER_PATHS" );
-
-	OSLQuery query;
-	if( !query.open( shaderName, searchPath ? searchPath : "" ) )
-	{
-		throw Exception( query.geterror() );
-	}
+	ConstOSLQueryPtr queryPtr = shaderQuery( shaderName );
+	const OSLQuery &query = *queryPtr;
 
 	const bool outPlugHadChildren = existingOut ? existingOut->children().size() : false;
 	if( !keepExistingValues )
@@ -1167,12 +1221,16 @@ static IECore::ConstCompoundDataPtr metadataGetter( const std::string &key, size
 		return nullptr;
 	}
 
-	const char *searchPath = getenv( "OSL_SHADER_PATHS" );
-	OSLQuery query;
-	if( !query.open( key, searchPath ? searchPath : "" ) )
+	ConstOSLQueryPtr queryPtr;
+	try
+	{
+		queryPtr = shaderQuery( key );
+	}
+	catch( ... )
 	{
 		return nullptr;
 	}
+	const OSLQuery &query = *queryPtr;
 
 	CompoundDataPtr metadata = new CompoundData;
 	metadata->writable()["shader"] = convertMetadata( query.metadata() );
@@ -1261,9 +1319,11 @@ const IECore::Data *OSLShader::parameterMetadata( const Gaffer::Plug *plug, cons
 
 void OSLShader::reloadShader()
 {
-	// Remove any metadata cache entry for the given shader name, allowing
+	// Remove any cache entries for the given shader name, allowing
 	// it to be reloaded fresh if it has changed
-	g_metadataCache.erase( namePlug()->getValue() );
+	const std::string shaderName = namePlug()->getValue();
+	g_queryCache.erase( queryCacheKey( shaderName ) );
+	g_metadataCache.erase( shaderName );
 	Shader::reloadShader();
 }
 